@@ -857,7 +857,9 @@ CONFIG_ENV_VAR = 'NEAR_PYTEST_CONFIG'
 
 
 def load_config():
-    config = DEFAULT_CONFIG
+    # Copy the defaults so that updates below do not leak into
+    # DEFAULT_CONFIG and surprise later callers.
+    config = dict(DEFAULT_CONFIG)
 
     config_file = os.environ.get(CONFIG_ENV_VAR, '')
     if config_file:
@@ -1,3 +1,5 @@
+import itertools
+
 import numpy as np
 from sklearn.linear_model import LinearRegression
 
@@ -16,12 +18,7 @@ def compute_cumulative(xs):
     E.g. given [1, 2, 3, 4] the return value will be
     [1, 3, 6, 10].
     '''
-    total = xs[0]
-    result = [total]
-    for x in xs[1:]:
-        total += x
-        result.append(total)
-    return result
+    return list(itertools.accumulate(xs))
 
 
 def linear_regression(xs, ys):
@@ -46,6 +43,6 @@ def compute_rate(timestamps):
     timestamps are seconds, then the output units will
     be `events/s`.
     '''
-    cumulative_events = [i for i in range(1, len(timestamps) + 1)]
+    cumulative_events = list(range(1, len(timestamps) + 1))
     fit = linear_regression(timestamps, cumulative_events)
     return fit['slope']
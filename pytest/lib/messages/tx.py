@@ -9,40 +9,45 @@ class Transaction:
     pass
 
 
+# The action classes carry exactly their schema fields and are allocated for
+# every transaction, so declare __slots__ to avoid a per-instance __dict__.
+# Transaction and SignedTransaction intentionally keep theirs: external tools
+# (e.g. tests/replay) attach extra attributes to them.
 class Action:
-    pass
+    __slots__ = ('enum', 'createAccount', 'deployContract', 'functionCall',
+                 'transfer', 'stake', 'addKey', 'deleteKey', 'deleteAccount')
 
 
 class CreateAccount:
-    pass
+    __slots__ = ()
 
 
 class DeployContract:
-    pass
+    __slots__ = ('code',)
 
 
 class FunctionCall:
-    pass
+    __slots__ = ('methodName', 'args', 'gas', 'deposit')
 
 
 class Transfer:
-    pass
+    __slots__ = ('deposit',)
 
 
 class Stake:
-    pass
+    __slots__ = ('stake', 'publicKey')
 
 
 class AddKey:
-    pass
+    __slots__ = ('publicKey', 'accessKey')
 
 
 class DeleteKey:
-    pass
+    __slots__ = ('publicKey',)
 
 
 class DeleteAccount:
-    pass
+    __slots__ = ('beneficiaryId',)
 
 
 class Receipt:
@@ -1,3 +1,4 @@
+import copy
 import json
 import os
 import random
@@ -267,15 +268,15 @@ def chain_measure_bps_and_tps(archival_node,
     while curr_time > start_time:
         if curr_time < end_time:
             block_times.append(curr_time)
+            chunks = curr_block['chunks']
             gas_per_chunk = []
-            for chunk in curr_block['chunks']:
+            for chunk in chunks:
                 gas_per_chunk.append(chunk['gas_used'] * 1e-12)
             gas_block = sum(gas_per_chunk)
-            tx_per_chunk = [None] * len(curr_block['chunks'])
+            tx_per_chunk = [None] * len(chunks)
             pmap(
-                lambda i: get_chunk_txn(i, curr_block['chunks'], archival_node,
-                                        tx_per_chunk),
-                range(len(curr_block['chunks'])))
+                lambda i: get_chunk_txn(i, chunks, archival_node, tx_per_chunk),
+                range(len(chunks)))
             txs = sum(tx_per_chunk)
             tx_count.append(txs)
             logger.info(
@@ -1077,7 +1078,7 @@ def create_and_upload_config_file_from_default(nodes, chain_id, overrider=None):
         config_json['telemetry']['endpoints'] = []
 
     for node in nodes:
-        copied_config = json.loads(json.dumps(config_json))
+        copied_config = copy.deepcopy(config_json)
         if overrider:
             overrider(node, copied_config)
         upload_json(node, '/home/ubuntu/.near/config.json', copied_config)
@@ -1302,10 +1303,8 @@ def create_upgrade_schedule(rpc_nodes, validator_nodes, progressive_upgrade,
                 )
     else:
         # Start all nodes upgraded.
-        for node in rpc_nodes:
-            schedule[node.instance_name] = 0
-        for node in validator_nodes:
-            schedule[node.instance_name] = 0
+        schedule = dict.fromkeys(
+            (node.instance_name for node in rpc_nodes + validator_nodes), 0)
 
     return schedule
 
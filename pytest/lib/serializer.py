@@ -14,17 +14,10 @@ class BinarySerializer:
 
     def serialize_num(self, value, n_bytes):
         assert value >= 0
-        for i in range(n_bytes):
-            self.array.append(value & 255)
-            value //= 256
-        assert value == 0
+        self.array += value.to_bytes(n_bytes, byteorder='little')
 
     def deserialize_num(self, n_bytes):
-        value = 0
-        bytes_ = self.read_bytes(n_bytes)
-        for b in bytes_[::-1]:
-            value = value * 256 + b
-        return value
+        return int.from_bytes(self.read_bytes(n_bytes), byteorder='little')
 
     def serialize_field(self, value, fieldType):
         if type(fieldType) == tuple:
@@ -75,13 +75,20 @@ if __name__ == '__main__':
     if contract_type == "compute":
         method_name = "infinite_loop"
 
+    # The args are the same for every request (`min(400 + i, 400)` is always
+    # 400), so build the payload once instead of once per transaction.
+    call_args = '{"how_many": 400}'.encode("utf-8")
+
+    # Bind the send method once, the attribute lookup is otherwise repeated
+    # for every single request.
+    send_call = my_account.send_call_contract_raw_tx
+
     for i in tqdm(range(args.num_requests)):
         for y in accounts:
-            result = my_account.send_call_contract_raw_tx(
-                contract_id=y,
-                method_name=method_name,
-                args=f'{{"how_many": {min(400 + i, 400)}}}'.encode("utf-8"),
-                deposit=0)
+            result = send_call(contract_id=y,
+                               method_name=method_name,
+                               args=call_args,
+                               deposit=0)
             results.append(result)
 
     if contract_type == 'storage':
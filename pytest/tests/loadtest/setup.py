@@ -4,6 +4,7 @@ import account
 import key
 import argparse
 from os.path import join
+from rc import pmap
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Setup loadtest')
@@ -23,13 +24,20 @@ if __name__ == '__main__':
     ],
                           cwd=args.contract_dir)
 
-    for i in range(args.num_accounts):
-        account_name = args.account_id or f"shard{i}"
+    account_names = [args.account_id] if args.account_id else [
+        f"shard{i}" for i in range(args.num_accounts)
+    ]
 
+    # All deployments can share the same base block hash, fetch it once.
+    base_block_hash = mocknet_helpers.get_latest_block_hash(addr=args.host)
+    contract_path = join(
+        args.contract_dir,
+        "target/wasm32-unknown-unknown/release/loadtest_contract.wasm")
+
+    def deploy_contract(account_name):
         shard_key = key.Key.from_json_file(
             join(args.home, f"{account_name}_key.json"))
 
-        base_block_hash = mocknet_helpers.get_latest_block_hash(addr=args.host)
         nonce = mocknet_helpers.get_nonce_for_key(shard_key, addr=args.host)
 
         shard_account = account.Account(shard_key,
@@ -37,7 +45,8 @@ if __name__ == '__main__':
                                         base_block_hash=base_block_hash,
                                         rpc_infos=[(args.host, "3030")])
 
-        shard_account.send_deploy_contract_tx(
-            join(
-                args.contract_dir,
-                "target/wasm32-unknown-unknown/release/loadtest_contract.wasm"))
+        shard_account.send_deploy_contract_tx(contract_path)
+
+    # The deployments are independent network round-trips, run them in
+    # parallel instead of one account at a time.
+    pmap(deploy_contract, account_names)
@@ -25,9 +25,19 @@ from configured_logger import logger
 CONTRACT_DEPLOY_TIME = 10 * mocknet.NUM_ACCOUNTS
 TEST_TIMEOUT = 12 * 60 * 60
 
-
-def send_transfer(account, node_account):
-    next_id = random.randrange(mocknet.NUM_ACCOUNTS)
+# Everything but the receiver is constant in the ft_transfer_call args, so
+# keep the constant parts as pre-encoded bytes and only splice the receiver
+# in, instead of formatting and utf-8 encoding the whole payload per tx.
+FT_TRANSFER_ARGS_PREFIX = b'{"receiver_id": "'
+FT_TRANSFER_ARGS_SUFFIX = b'", "amount": "3", "msg": "\\"hi\\""}'
+
+
+def send_transfer(account, i, node_account):
+    # Pick a receiver uniformly among the other load testing accounts:
+    # draw from a range one short and shift the result past our own index.
+    next_id = random.randrange(mocknet.NUM_ACCOUNTS - 1)
+    if next_id >= i:
+        next_id += 1
     dest_account_id = mocknet.load_testing_account_id(
         node_account.key.account_id, next_id)
     mocknet_helpers.retry_and_ignore_errors(
@@ -91,13 +101,14 @@ def function_call_ft_transfer_call(account, i, node_account):
     dest_account_id = mocknet.load_testing_account_id(
         node_account.key.account_id, next_id)
 
-    s = f'{{"receiver_id": "{dest_account_id}", "amount": "3", "msg": "\\"hi\\""}}'
+    s = (FT_TRANSFER_ARGS_PREFIX + dest_account_id.encode('utf-8') +
+         FT_TRANSFER_ARGS_SUFFIX)
     logger.info(
         f'Calling function "ft_transfer_call" with arguments {s} on account {account.key.account_id} contract {dest_account_id}'
     )
     tx_res = mocknet_helpers.retry_and_ignore_errors(
-        lambda: account.send_call_contract_raw_tx(
-            dest_account_id, 'ft_transfer_call', s.encode('utf-8'), 1))
+        lambda: account.send_call_contract_raw_tx(dest_account_id,
+                                                  'ft_transfer_call', s, 1))
     logger.info(
         f'{account.key.account_id} ft_transfer to {dest_account_id} {tx_res}')
 
@@ -110,7 +121,7 @@ def random_transaction(account, i, node_account, max_tps_per_node):
     choice = random.randint(0, 2)
     if choice == 0:
         logger.info(f'Account {i} transfers')
-        send_transfer(account, node_account)
+        send_transfer(account, i, node_account)
     elif choice == 1:
         function_call_set_delete_state(account, i, node_account)
     elif choice == 2:
@@ -159,13 +170,14 @@ def get_test_accounts_from_args(argv):
                                        node_account_key.pk),
                                    base_block_hash,
                                    rpc_infos=rpc_infos)
-    accounts = [
-        account.Account(key,
-                        mocknet_helpers.get_nonce_for_pk(
-                            key.account_id, key.pk),
-                        base_block_hash,
-                        rpc_infos=rpc_infos) for key in test_account_keys
-    ]
+    # Creating an account requires an RPC round-trip for the nonce; doing
+    # that serially for every test account makes startup needlessly slow.
+    accounts = pmap(
+        lambda key: account.Account(key,
+                                    mocknet_helpers.get_nonce_for_pk(
+                                        key.account_id, key.pk),
+                                    base_block_hash,
+                                    rpc_infos=rpc_infos), test_account_keys)
     max_tps_per_node = max_tps / num_nodes
     return node_account, accounts, max_tps_per_node
 
@@ -27,6 +27,11 @@ CONTRACT_DEPLOY_TIME = 12 * mocknet.NUM_ACCOUNTS
 TEST_TIMEOUT = 12 * 60 * 60
 SKYWARD_INIT_TIME = 120
 
+# The skyward function calls sent in the hot loop always use the same
+# arguments, so encode them once instead of on every transaction.
+WITHDRAW_TOKEN_ARGS = b'{"token_account_id": "token2.near"}'
+SALE_DEPOSIT_ARGS = b'{"sale_id": 0, "amount": "1"}'
+
 
 def send_transfer(account, i, node_account):
     next_id = random.randrange(mocknet.NUM_ACCOUNTS)
@@ -37,24 +42,22 @@ def send_transfer(account, i, node_account):
 
 def function_call(account, i, node_account):
     if random.randint(0, 1) == 0:
-        s = f'{{"token_account_id": "token2.near"}}'
         logger.info(
-            f'Calling function "withdraw_token" with arguments {s} on account {i}'
+            f'Calling function "withdraw_token" with arguments {WITHDRAW_TOKEN_ARGS} on account {i}'
         )
         tx_res = mocknet_helpers.retry_and_ignore_errors(
             lambda: account.send_call_contract_raw_tx(
-                mocknet.SKYWARD_ACCOUNT, 'withdraw_token',
-                bytes(s, encoding='utf-8'), 0))
+                mocknet.SKYWARD_ACCOUNT, 'withdraw_token', WITHDRAW_TOKEN_ARGS,
+                0))
         logger.info(f'Account {account.key.account_id} withdraw_token {tx_res}')
     else:
-        s = '{"sale_id": 0, "amount": "1"}'
         logger.info(
-            f'Calling function "sale_deposit_in_token" with arguments {s} on account {i}'
+            f'Calling function "sale_deposit_in_token" with arguments {SALE_DEPOSIT_ARGS} on account {i}'
         )
         tx_res = mocknet_helpers.retry_and_ignore_errors(
-            lambda: account.send_call_contract_raw_tx(
-                mocknet.SKYWARD_ACCOUNT, 'sale_deposit_in_token',
-                bytes(s, encoding='utf-8'), 1))
+            lambda: account.send_call_contract_raw_tx(mocknet.SKYWARD_ACCOUNT,
+                                                      'sale_deposit_in_token',
+                                                      SALE_DEPOSIT_ARGS, 1))
         logger.info(
             f'Account {account.key.account_id} sale_deposit_in_token {tx_res}')
 
@@ -202,13 +205,14 @@ def get_test_accounts_from_args(argv):
                                        node_account_key.pk),
                                    base_block_hash,
                                    rpc_infos=rpc_infos)
-    accounts = [
-        account.Account(key,
-                        mocknet_helpers.get_nonce_for_pk(
-                            key.account_id, key.pk),
-                        base_block_hash,
-                        rpc_infos=rpc_infos) for key in test_account_keys
-    ]
+    # Creating an account requires an RPC round-trip for the nonce; doing
+    # that serially for every test account makes startup needlessly slow.
+    accounts = pmap(
+        lambda key: account.Account(key,
+                                    mocknet_helpers.get_nonce_for_pk(
+                                        key.account_id, key.pk),
+                                    base_block_hash,
+                                    rpc_infos=rpc_infos), test_account_keys)
     max_tps_per_node = max_tps / num_nodes
 
     special_account_keys = [
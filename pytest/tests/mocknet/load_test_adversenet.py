@@ -14,7 +14,6 @@ This script will always initializes the network from scratch, and that is the in
 why it's a good idea to just always start from scratch.)
 """
 import argparse
-import random
 import sys
 import time
 from rc import pmap
@@ -14,6 +14,12 @@ from configured_logger import logger
 NUM_LETTERS = 26
 NUM_ACCOUNTS = NUM_LETTERS * 5
 
+# Everything but the receiver is constant in the ft_transfer_call args, so
+# keep the constant parts as pre-encoded bytes and only splice the receiver
+# in, instead of formatting and utf-8 encoding the whole payload per tx.
+FT_TRANSFER_ARGS_PREFIX = b'{"receiver_id": "'
+FT_TRANSFER_ARGS_SUFFIX = b'", "amount": "3", "msg": "\\"hi\\""}'
+
 
 def load_testing_account_id(node_account_id, i):
     letter = i % NUM_LETTERS
@@ -21,8 +27,12 @@ def load_testing_account_id(node_account_id, i):
     return '%s%02d.%s' % (chr(ord('a') + letter), num, node_account_id)
 
 
-def send_transfer(account, node_account, base_block_hash=None):
-    next_id = random.randrange(NUM_ACCOUNTS)
+def send_transfer(account, i, node_account, base_block_hash=None):
+    # Pick a receiver uniformly among the other load testing accounts:
+    # draw from a range one short and shift the result past our own index.
+    next_id = random.randrange(NUM_ACCOUNTS - 1)
+    if next_id >= i:
+        next_id += 1
     dest_account_id = load_testing_account_id(node_account.key.account_id,
                                               next_id)
     mocknet_helpers.retry_and_ignore_errors(lambda: account.send_transfer_tx(
@@ -98,17 +108,15 @@ def function_call_ft_transfer_call(account, node_account, base_block_hash=None):
                                               next_id)
     contract = node_account.key.account_id
 
-    s = f'{{"receiver_id": "{dest_account_id}", "amount": "3", "msg": "\\"hi\\""}}'
+    s = (FT_TRANSFER_ARGS_PREFIX + dest_account_id.encode('utf-8') +
+         FT_TRANSFER_ARGS_SUFFIX)
     logger.info(
         f'Calling function "ft_transfer_call" with arguments {s} on account {account.key.account_id} contract {contract} with destination {dest_account_id}'
     )
     tx_res = mocknet_helpers.retry_and_ignore_errors(
-        lambda: account.send_call_contract_raw_tx(contract,
-                                                  'ft_transfer_call',
-                                                  s.encode('utf-8'),
-                                                  1,
-                                                  base_block_hash=
-                                                  base_block_hash))
+        lambda: account.send_call_contract_raw_tx(
+            contract, 'ft_transfer_call', s, 1, base_block_hash=base_block_hash)
+    )
     logger.info(
         f'{account.key.account_id} ft_transfer to {dest_account_id} {tx_res}')
 
@@ -122,7 +130,7 @@ def random_transaction(account,
     choice = random.randint(0, 2)
     if choice == 0:
         logger.info(f'Account {i} transfers')
-        send_transfer(account, node_account, base_block_hash=base_block_hash)
+        send_transfer(account, i, node_account, base_block_hash=base_block_hash)
     elif choice == 1:
         function_call_set_delete_state(account,
                                        i,